@@ -0,0 +1,108 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from sqlalchemy.orm import undefer
+
+from app import (
+    app, sqlalchemy_session, CandidateProfile, _extract_batch_worker, extract_entities_batch, RESUME_EMAIL_RE
+)
+from bulk_ingest import collect_resume_files
+
+
+def needs_backfill(candidate):
+    return not candidate.name or candidate.city in (None, '', 'Unknown') or candidate.region in (None, '', 'Unknown')
+
+
+def apply_to_candidate(candidate, entities):
+    """Fill missing name/city/region on a candidate. Returns True if anything changed."""
+    changed = False
+    if not candidate.name and entities['name']:
+        candidate.name = entities['name']
+        changed = True
+    if candidate.city in (None, '', 'Unknown') and entities['city']:
+        candidate.city = entities['city']
+        changed = True
+    if candidate.region in (None, '', 'Unknown') and entities['region']:
+        candidate.region = entities['region']
+        changed = True
+    return changed
+
+
+def backfill_from_files(inputs, workers, batch_size):
+    """Extract text from resume files in a process pool, run batched NER and match profiles by email."""
+    work_dir = os.path.join(app.config['BULK_UPLOAD_FOLDER'], f"backfill_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    file_paths = collect_resume_files(inputs, work_dir)
+    chunk_size = app.config['BULK_EXTRACT_CHUNK_SIZE']
+    chunks = [file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
+    updated = pending = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for results in pool.map(_extract_batch_worker, chunks):
+            for file_path, text, error, local_result, entities, _ in results:
+                if not text or not entities:
+                    continue
+                email = local_result[0]['email'] if local_result else ''
+                if not email:
+                    match = RESUME_EMAIL_RE.search(text)
+                    email = match.group(0) if match else ''
+                if not email:
+                    continue
+                candidate = sqlalchemy_session.query(CandidateProfile).filter_by(email=email).first()
+                if candidate and apply_to_candidate(candidate, entities):
+                    updated += 1
+                    pending += 1
+                if pending >= batch_size:
+                    sqlalchemy_session.commit()
+                    pending = 0
+    sqlalchemy_session.commit()
+    return updated
+
+
+def backfill_from_database(batch_size):
+    """Run batched NER over resume text already stored in candidate_profiles."""
+    updated = 0
+    last_id = 0
+    while True:
+        candidates = sqlalchemy_session.query(CandidateProfile).options(undefer(CandidateProfile.resume)).filter(
+            CandidateProfile.id > last_id,
+            CandidateProfile.resume.isnot(None)
+        ).order_by(CandidateProfile.id).limit(batch_size).all()
+        if not candidates:
+            break
+        last_id = candidates[-1].id
+        candidates = [c for c in candidates if needs_backfill(c)]
+        entities_list = extract_entities_batch([c.resume for c in candidates]) if candidates else []
+        if entities_list is None:
+            print("❌ spaCy NER is not available")
+            break
+        for candidate, entities in zip(candidates, entities_list):
+            if apply_to_candidate(candidate, entities):
+                updated += 1
+        sqlalchemy_session.commit()
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill candidate name/city/region with batched spaCy NER")
+    parser.add_argument('inputs', nargs='*', help="Zip archives, directories or resume files to re-read")
+    parser.add_argument('--from-db', action='store_true', help="Use resume text stored in candidate_profiles")
+    parser.add_argument('--workers', type=int, default=app.config['BULK_EXTRACT_WORKERS'])
+    parser.add_argument('--batch-size', type=int, default=app.config['BULK_COMMIT_BATCH_SIZE'])
+    args = parser.parse_args()
+
+    if not args.inputs and not args.from_db:
+        parser.error("give resume inputs or --from-db")
+
+    print("🔄 Backfilling candidate entities...")
+    updated = 0
+    if args.inputs:
+        updated += backfill_from_files(args.inputs, args.workers, args.batch_size)
+    if args.from_db:
+        updated += backfill_from_database(args.batch_size)
+    print(f"✅ Updated {updated} candidate profiles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import random
+import time
+
+from app import app, get_ner_model, extract_entities_batch, extract_text_from_file
+from bulk_ingest import collect_resume_files
+
+SAMPLE_NAMES = ['Rahul Kumar', 'Priya Sharma', 'Ananya Das', 'Vikram Singh', 'Sneha Patel', 'Arjun Mehta']
+SAMPLE_PLACES = [('Bhubaneswar', 'Odisha'), ('Pune', 'Maharashtra'), ('Bengaluru', 'Karnataka'),
+                 ('Hyderabad', 'Telangana'), ('Chennai', 'Tamil Nadu'), ('Kolkata', 'West Bengal')]
+
+
+def synthesize_texts(count):
+    """Build resume-like headers so the benchmark runs without sample files."""
+    rng = random.Random(42)
+    texts = []
+    for index in range(count):
+        name = rng.choice(SAMPLE_NAMES)
+        city, region = rng.choice(SAMPLE_PLACES)
+        texts.append(
+            f"{name}\n{city}, {region} | +91-98765{index % 100000:05d} | candidate{index}@example.com\n"
+            f"OBJECTIVE\nMotivated engineer from {city} looking for backend roles.\n"
+            f"EDUCATION\nB.Tech in Computer Science, {city} Institute of Technology, 2024\n"
+            f"SKILLS\nPython, SQL, React, Docker\n"
+        )
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-document spaCy calls with batched nlp.pipe")
+    parser.add_argument('inputs', nargs='*', help="Resume files, directories or zips (default: synthetic texts)")
+    parser.add_argument('--count', type=int, default=500, help="Synthetic documents when no inputs are given")
+    parser.add_argument('--batch-size', type=int, default=app.config['NER_BATCH_SIZE'])
+    args = parser.parse_args()
+
+    nlp = get_ner_model()
+    if nlp is None:
+        print("❌ spaCy NER is not available (install spaCy and the model set in NER_MODEL)")
+        return
+
+    if args.inputs:
+        texts = [text for text, _ in map(extract_text_from_file, collect_resume_files(args.inputs, 'uploads/bench'))]
+        texts = [text for text in texts if text]
+    else:
+        texts = synthesize_texts(args.count)
+    max_chars = app.config['NER_MAX_CHARS']
+
+    # Warm up so model initialisation doesn't count against either mode
+    list(nlp.pipe(texts[:8]))
+
+    started = time.perf_counter()
+    for text in texts:
+        nlp(text[:max_chars])
+    per_doc_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    extract_entities_batch(texts, batch_size=args.batch_size)
+    batched_seconds = time.perf_counter() - started
+
+    print(f"📊 {len(texts)} documents, pipes: {nlp.pipe_names}")
+    print(f"   Per-document calls: {len(texts) / per_doc_seconds:8.1f} docs/sec")
+    print(f"   nlp.pipe (batch {args.batch_size}): {len(texts) / batched_seconds:8.1f} docs/sec")
+    print(f"   Speed-up: {per_doc_seconds / batched_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
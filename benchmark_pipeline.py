@@ -0,0 +1,141 @@
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark /upload, /job-recommendations and bulk ingestion against the stub LLM backend"
+    )
+    parser.add_argument('inputs', nargs='*', help="Resume files, directories or zips (default: synthetic DOCX resumes)")
+    parser.add_argument('--mode', choices=['upload', 'recommendations', 'bulk', 'all'], default='all')
+    parser.add_argument('--count', type=int, default=50, help="Synthetic resumes / recommendation requests")
+    parser.add_argument('--concurrency', type=int, default=8, help="Concurrent clients for the endpoint benchmarks")
+    parser.add_argument('--latency', help="Stub latency distribution, e.g. fixed:0.2 or lognormal:-0.7,0.35")
+    parser.add_argument('--error-rate', type=float, help="Fraction of stub calls that fail")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-local-parser', action='store_true', help="Send every resume to the LLM")
+    parser.add_argument('--warm-caches', action='store_true', help="Keep the resume, recommendation and LLM caches on")
+    parser.add_argument('--provider', default='stub', help="LLM_PROVIDER to benchmark (default: stub)")
+    return parser.parse_args()
+
+
+def configure_environment(args, work_dir):
+    """app reads its settings at import time, so the benchmark sets them first."""
+    os.environ['LLM_PROVIDER'] = args.provider
+    os.environ['LLM_STUB_SEED'] = str(args.seed)
+    if args.latency:
+        os.environ['LLM_STUB_LATENCY'] = args.latency
+    if args.error_rate is not None:
+        os.environ['LLM_STUB_ERROR_RATE'] = str(args.error_rate)
+    if args.no_local_parser:
+        os.environ['LOCAL_PARSER_ENABLED'] = '0'
+    if not args.warm_caches:
+        os.environ['RESUME_CACHE_MAX_ENTRIES'] = '0'
+        os.environ['RECOMMENDATION_CACHE_MAX_ENTRIES'] = '0'
+        os.environ['LLM_CACHE_WARM_ENTRIES'] = '0'
+        # A zero TTL turns every LLM cache lookup into a miss; the throwaway path keeps
+        # benchmark replies out of the real cache
+        os.environ['LLM_CACHE_TTL_SECONDS'] = '0'
+        os.environ['LLM_CACHE_PATH'] = os.path.join(work_dir, 'llm_cache.db')
+
+
+def write_synthetic_resumes(texts, target_dir):
+    import docx
+    os.makedirs(target_dir, exist_ok=True)
+    file_paths = []
+    for index, text in enumerate(texts):
+        document = docx.Document()
+        for line in text.splitlines():
+            document.add_paragraph(line)
+        file_path = os.path.join(target_dir, f"resume_{index:05d}.docx")
+        document.save(file_path)
+        file_paths.append(file_path)
+    return file_paths
+
+
+def report(label, latencies, elapsed, failures):
+    latencies = sorted(latencies)
+    if not latencies:
+        print(f"❌ {label}: no successful requests")
+        return
+    percentile = lambda p: latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))]
+    print(f"📊 {label}: {len(latencies)} ok, {failures} failed in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:.1f} req/s)")
+    print(f"   p50 {percentile(50) * 1000:.0f} ms  p95 {percentile(95) * 1000:.0f} ms  "
+          f"p99 {percentile(99) * 1000:.0f} ms  mean {statistics.mean(latencies) * 1000:.0f} ms")
+
+
+def run_concurrently(label, requests_to_send, send, concurrency):
+    """Send every request from a pool of concurrent clients and report latency percentiles."""
+    def timed(item):
+        started = time.perf_counter()
+        ok = send(item)
+        return ok, time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed, requests_to_send))
+    elapsed = time.perf_counter() - started
+    report(label, [latency for ok, latency in results if ok], elapsed, sum(1 for ok, _ in results if not ok))
+
+
+def main():
+    args = parse_args()
+    work_dir = tempfile.mkdtemp(prefix='cvisionary_bench_')
+    configure_environment(args, work_dir)
+
+    from app import app, bulk_ingest_resumes, llm_client, SKILLS_DICTIONARY
+    from bulk_ingest import collect_resume_files
+    from benchmark_ner import synthesize_texts
+
+    if args.inputs:
+        file_paths = collect_resume_files(args.inputs, work_dir)
+    else:
+        file_paths = write_synthetic_resumes(synthesize_texts(args.count), os.path.join(work_dir, 'resumes'))
+    print(f"🔄 Benchmarking with {len(file_paths)} resumes, provider {llm_client.provider.name}, "
+          f"{args.concurrency} concurrent clients")
+
+    client = app.test_client
+
+    def upload(file_path):
+        with client() as http:
+            with http.session_transaction() as http_session:
+                http_session['user_logged_in'] = True
+                http_session['username'] = 'benchmark'
+            with open(file_path, 'rb') as f:
+                response = http.post('/upload?sync=1', data={'resume': (f, os.path.basename(file_path))},
+                                     content_type='multipart/form-data')
+            return response.status_code == 200 and response.get_json().get('success', False)
+
+    def recommend(skills):
+        with client() as http:
+            response = http.post('/job-recommendations', json={'skills': skills})
+            return response.status_code == 200
+
+    if args.mode in ('upload', 'all'):
+        run_concurrently('/upload', file_paths, upload, args.concurrency)
+
+    if args.mode in ('recommendations', 'all'):
+        rng = random.Random(args.seed)
+        skill_pool = sorted(SKILLS_DICTIONARY)
+        skill_sets = [rng.sample(skill_pool, rng.randint(3, 8)) for _ in range(args.count)]
+        run_concurrently('/job-recommendations', skill_sets, recommend, args.concurrency)
+
+    if args.mode in ('bulk', 'all'):
+        started = time.perf_counter()
+        summary = bulk_ingest_resumes(file_paths, os.path.join(work_dir, 'manifest.jsonl'))
+        elapsed = time.perf_counter() - started
+        print(f"📊 bulk ingestion: {summary['stored']} stored, {summary['failed']} failed in {elapsed:.2f}s "
+              f"({summary['total'] / elapsed:.1f} resumes/s)")
+
+    print(f"ℹ️ LLM client: {llm_client.stats()}")
+    print(f"ℹ️ Work files in {work_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import os
+from datetime import datetime
+
+from app import app, bulk_ingest_resumes, extract_resume_zip, SUPPORTED_RESUME_EXTENSIONS
+
+
+def collect_resume_files(inputs, work_dir):
+    """Expand zip archives, directories and single files into a list of resume paths."""
+    file_paths = []
+    for index, path in enumerate(inputs):
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for filename in sorted(files):
+                    if os.path.splitext(filename)[1].lower() in SUPPORTED_RESUME_EXTENSIONS:
+                        file_paths.append(os.path.join(root, filename))
+        elif path.lower().endswith('.zip'):
+            target_dir = os.path.join(work_dir, f"archive_{index}")
+            file_paths.extend(extract_resume_zip(path, target_dir))
+        elif os.path.splitext(path)[1].lower() in SUPPORTED_RESUME_EXTENSIONS:
+            file_paths.append(path)
+        else:
+            print(f"ℹ️ Skipping unsupported input: {path}")
+    return file_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk ingest PDF/DOCX resumes into candidate_profiles")
+    parser.add_argument('inputs', nargs='+', help="Zip archives, directories or resume files")
+    parser.add_argument('--manifest', help="Path of the per-file JSON lines manifest")
+    parser.add_argument('--workers', type=int, default=app.config['BULK_EXTRACT_WORKERS'],
+                        help="Text extraction processes (default: CPU count)")
+    parser.add_argument('--llm-concurrency', type=int, default=app.config['BULK_LLM_CONCURRENCY'],
+                        help="Maximum concurrent Gemini calls")
+    parser.add_argument('--batch-size', type=int, default=app.config['BULK_COMMIT_BATCH_SIZE'],
+                        help="Profiles committed per database transaction")
+    args = parser.parse_args()
+
+    run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+    work_dir = os.path.join(app.config['BULK_UPLOAD_FOLDER'], f"cli_{run_id}")
+    manifest_path = args.manifest or os.path.join(work_dir, 'manifest.jsonl')
+
+    file_paths = collect_resume_files(args.inputs, work_dir)
+    if not file_paths:
+        print("❌ No PDF or DOCX files found")
+        return
+    print(f"🔄 Ingesting {len(file_paths)} resumes with {args.workers} extraction workers...")
+
+    summary = bulk_ingest_resumes(
+        file_paths,
+        manifest_path,
+        max_workers=args.workers,
+        llm_concurrency=args.llm_concurrency,
+        batch_size=args.batch_size
+    )
+    print(f"✅ Stored: {summary['stored']}  ❌ Failed: {summary['failed']}  "
+          f"⏱️ {summary['elapsed_seconds']}s  📄 Manifest: {summary['manifest']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import os
+import time
+from datetime import datetime
+
+from app import app, CANDIDATE_EXPORT_TABLES, stream_candidate_export
+
+
+def export_table(table, export_format, output_dir):
+    """Write one table to output_dir as it is generated. Returns (path, bytes written)."""
+    chunks = stream_candidate_export(table, export_format)
+    path = os.path.join(output_dir, f"{table}.{export_format}")
+    size = 0
+    with open(path, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+            size += len(chunk)
+    return path, size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export the candidate pool as Parquet or NDJSON with typed columns and one row per skill"
+    )
+    parser.add_argument('--format', choices=['parquet', 'ndjson'], default='parquet')
+    parser.add_argument('--table', choices=CANDIDATE_EXPORT_TABLES + ('all',), default='all')
+    parser.add_argument('--output-dir', help="Directory for the files (default: exports/<timestamp>)")
+    parser.add_argument('--batch-size', type=int, default=app.config['EXPORT_BATCH_SIZE'],
+                        help="Rows read from the database per batch")
+    args = parser.parse_args()
+
+    app.config['EXPORT_BATCH_SIZE'] = args.batch_size
+    output_dir = args.output_dir or os.path.join('exports', datetime.now().strftime('%Y%m%d_%H%M%S'))
+    os.makedirs(output_dir, exist_ok=True)
+    tables = CANDIDATE_EXPORT_TABLES if args.table == 'all' else (args.table,)
+
+    for table in tables:
+        started = time.perf_counter()
+        try:
+            path, size = export_table(table, args.format, output_dir)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            return
+        print(f"✅ Wrote {path} ({size / 1024:.0f} KB) in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
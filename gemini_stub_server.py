@@ -0,0 +1,95 @@
+import argparse
+import json
+import random
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GENERATE_PATH_RE = re.compile(r"^/v1beta/models/[^/:]+:generateContent")
+# The REST transport sends schema types as enum numbers
+SCHEMA_TYPE_NAMES = {1: 'STRING', 2: 'NUMBER', 3: 'INTEGER', 4: 'BOOLEAN', 5: 'ARRAY', 6: 'OBJECT'}
+
+
+def sample_from_schema(schema):
+    """Build the smallest value that satisfies a Gemini response schema."""
+    schema_type = (schema or {}).get('type', 'STRING')
+    schema_type = SCHEMA_TYPE_NAMES.get(schema_type, str(schema_type).upper())
+    if schema_type == 'OBJECT':
+        return {name: sample_from_schema(field) for name, field in schema.get('properties', {}).items()}
+    if schema_type == 'ARRAY':
+        return []
+    if schema_type in ('NUMBER', 'INTEGER'):
+        return 0
+    if schema_type == 'BOOLEAN':
+        return False
+    return ""
+
+
+class GeminiStubHandler(BaseHTTPRequestHandler):
+    """Answers generateContent calls with canned JSON, injected latency and injected errors."""
+
+    def do_POST(self):
+        if not GENERATE_PATH_RE.match(self.path):
+            self._send(404, {'error': {'code': 404, 'message': 'Not found', 'status': 'NOT_FOUND'}})
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        options = self.server.options
+        time.sleep(options.latency + random.uniform(0, options.jitter))
+
+        if random.random() < options.fail_rate:
+            status = options.fail_status
+            self._send(status, {'error': {'code': status, 'message': 'Injected failure', 'status': 'UNAVAILABLE'}})
+            return
+
+        if options.reply_file:
+            with open(options.reply_file, encoding='utf-8') as f:
+                text = f.read()
+        else:
+            schema = body.get('generationConfig', {}).get('responseSchema')
+            text = json.dumps(sample_from_schema(schema))
+        self._send(200, {
+            'candidates': [{
+                'content': {'parts': [{'text': text}], 'role': 'model'},
+                'finishReason': 'STOP',
+                'index': 0
+            }]
+        })
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.options.verbose:
+            super().log_message(format, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the Gemini REST API. Point the app at it with GEMINI_API_ENDPOINT=http://127.0.0.1:<port>"
+    )
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.2, help="Seconds added to every reply")
+    parser.add_argument('--jitter', type=float, default=0.1, help="Extra random latency, up to this many seconds")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="Fraction of calls answered with --fail-status")
+    parser.add_argument('--fail-status', type=int, default=503, help="HTTP status for injected failures, e.g. 429 or 503")
+    parser.add_argument('--reply-file', help="Reply text to return instead of a value built from the response schema")
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), GeminiStubHandler)
+    server.options = args
+    print(f"🔄 Gemini stub listening on http://127.0.0.1:{args.port} "
+          f"(latency {args.latency}s, fail rate {args.fail_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
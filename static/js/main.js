@@ -5,6 +5,8 @@ document.addEventListener('DOMContentLoaded', function() {
     const resultsSection = document.getElementById('resultsSection');
     const atsScoreSection = document.getElementById('atsScoreSection');
     const jobRecommendationsSection = document.getElementById('jobRecommendationsSection');
+    // Recommendations returned with the upload, reused by the Job Recommendations button
+    let uploadRecommendations = null;
 
     // Drag and drop handlers
     dropZone.addEventListener('dragover', (e) => {
@@ -55,12 +57,20 @@ document.addEventListener('DOMContentLoaded', function() {
                 body: formData
             });
 
-            const data = await response.json();
+            uploadRecommendations = null;
+            let data = await response.json();
+            if (data.success && data.job_id) {
+                // Processing happens in a background job; wait for it without holding the upload open
+                data = await waitForUploadJob(data, displaySection);
+            }
             if (data.success) {
                 displayResults(data.parsed_data);
                 if (data.improvements && data.improvements.length > 0) {
                     displayImprovements(data.improvements);
                 }
+                if (data.recommendations && data.recommendations.length > 0) {
+                    uploadRecommendations = data.recommendations;
+                }
                 resultsSection.classList.remove('hidden');
             } else {
                 if (response.status === 401) {
@@ -81,6 +91,100 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    function setLoadingMessage(message) {
+        const label = loadingOverlay.querySelector('.loader-content p');
+        if (label) {
+            label.textContent = message;
+        }
+    }
+
+    const stageMessages = {
+        queued: 'Waiting in queue...',
+        extracting: 'Extracting text from your resume...',
+        parsing: 'Analyzing your resume...',
+        scoring: 'Calculating ATS score...',
+        storing: 'Saving your profile...',
+        suggestions: 'Generating suggestions and job matches...'
+    };
+
+    // Render parts of the result as soon as the job publishes them
+    function displaySection(name, value) {
+        if (name === 'parsed_data') {
+            displayResults(value);
+            resultsSection.classList.remove('hidden');
+            // The rest arrives in the background, so let the user read what's there
+            loadingOverlay.classList.add('hidden');
+        } else if (name === 'improvements' && value && value.length > 0) {
+            displayImprovements(value);
+        } else if (name === 'recommendations' && value && value.length > 0) {
+            uploadRecommendations = value;
+        }
+    }
+
+    // Resolve with the job's final result, using server-sent events when available and polling otherwise.
+    // onSection(name, value) is called once for each result section as it becomes available.
+    function waitForUploadJob(job, onSection) {
+        const seenSections = new Set();
+        const publishSections = (snapshot) => {
+            if (!onSection || !snapshot.sections || snapshot.status !== 'running') {
+                return;
+            }
+            for (const [name, value] of Object.entries(snapshot.sections)) {
+                if (!seenSections.has(name)) {
+                    seenSections.add(name);
+                    onSection(name, value);
+                }
+            }
+        };
+
+        return new Promise((resolve, reject) => {
+            const finish = (snapshot) => {
+                setLoadingMessage('Processing your resume...');
+                resolve(snapshot.result || { error: snapshot.error || 'Failed to process resume' });
+            };
+
+            const poll = async () => {
+                try {
+                    const response = await fetch(job.status_url);
+                    const snapshot = await response.json();
+                    if (!response.ok) {
+                        throw new Error(snapshot.error || 'Failed to fetch job status');
+                    }
+                    setLoadingMessage(stageMessages[snapshot.stage] || 'Processing your resume...');
+                    publishSections(snapshot);
+                    if (snapshot.status === 'completed' || snapshot.status === 'failed') {
+                        finish(snapshot);
+                    } else {
+                        setTimeout(poll, 1000);
+                    }
+                } catch (error) {
+                    reject(error);
+                }
+            };
+
+            if (!window.EventSource || !job.events_url) {
+                poll();
+                return;
+            }
+
+            const source = new EventSource(job.events_url);
+            source.onmessage = (event) => {
+                const snapshot = JSON.parse(event.data);
+                setLoadingMessage(stageMessages[snapshot.stage] || 'Processing your resume...');
+                publishSections(snapshot);
+                if (snapshot.status === 'completed' || snapshot.status === 'failed') {
+                    source.close();
+                    finish(snapshot);
+                }
+            };
+            source.onerror = () => {
+                // Fall back to polling if the stream drops
+                source.close();
+                poll();
+            };
+        });
+    }
+
     function displayResults(data) {
         // Display personal details
         document.getElementById('name').textContent = data.name || 'N/A';
@@ -323,6 +427,13 @@ document.addEventListener('DOMContentLoaded', function() {
 
     // Handle Job Recommendations button click
     document.getElementById('jobRecommendBtn').addEventListener('click', async () => {
+        if (uploadRecommendations) {
+            // Already generated alongside the upload
+            displayJobRecommendations(uploadRecommendations);
+            jobRecommendationsSection.classList.remove('hidden');
+            jobRecommendationsSection.scrollIntoView({ behavior: 'smooth', block: 'start' });
+            return;
+        }
         try {
             const loadingOverlay = document.getElementById('loadingOverlay');
             loadingOverlay.classList.remove('hidden');
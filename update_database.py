@@ -1,5 +1,7 @@
+import json
 import mysql.connector
-from sqlalchemy import create_engine, text
+from sqlalchemy import inspect, text
+from sqlalchemy.types import DateTime, Float, Integer
 
 # Database configuration
 DB_CONFIG = {
@@ -46,7 +48,245 @@ def update_database_schema():
         if 'connection' in locals():
             connection.close()
 
+# Columns that older versions stored as strings, with their MySQL types after migration
+TYPED_COLUMNS = [
+    ('cgpa', 'FLOAT', Float),
+    ('academic_percentage', 'FLOAT', Float),
+    ('graduation_year', 'INT', Integer),
+    ('uploaded_at', 'DATETIME', DateTime)
+]
+INDEXED_COLUMNS = ['ats_score', 'cgpa', 'academic_percentage', 'graduation_year', 'uploaded_at']
+MIGRATION_BATCH_SIZE = 1000
+
+
+def normalize_row(row):
+    """Typed values for one candidate_profiles row, using the same parsers the app stores with"""
+    from app import normalize_academic_values, parse_uploaded_at
+    cgpa, percentage, graduation_year = normalize_academic_values(
+        row['cgpa'], row['academic_percentage'], row['graduation_year']
+    )
+    return {
+        'cgpa': cgpa,
+        'academic_percentage': percentage,
+        'graduation_year': graduation_year,
+        'uploaded_at': parse_uploaded_at(row['uploaded_at'])
+    }
+
+
+def iter_rows(connection, table, columns):
+    """Read a table in id order, one batch at a time"""
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            text(f"SELECT {', '.join(columns)} FROM {table} WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {'last_id': last_id, 'limit': MIGRATION_BATCH_SIZE}
+        ).mappings().all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1]['id']
+
+
+def migrate_mysql(engine):
+    """Normalize the string values in place, then change the column types"""
+    with engine.begin() as connection:
+        migrated = 0
+        for rows in iter_rows(connection, 'candidate_profiles',
+                              ['id'] + [name for name, _, _ in TYPED_COLUMNS]):
+            updates = []
+            for row in rows:
+                values = normalize_row(row)
+                if values['uploaded_at']:
+                    values['uploaded_at'] = values['uploaded_at'].strftime('%Y-%m-%d %H:%M:%S')
+                updates.append(dict(values, id=row['id']))
+            connection.execute(text(
+                "UPDATE candidate_profiles SET cgpa = :cgpa, academic_percentage = :academic_percentage, "
+                "graduation_year = :graduation_year, uploaded_at = :uploaded_at WHERE id = :id"
+            ), updates)
+            migrated += len(updates)
+            print(f"🔄 Normalized {migrated} rows")
+
+        modifications = ', '.join(f"MODIFY COLUMN {name} {sql_type} NULL" for name, sql_type, _ in TYPED_COLUMNS)
+        connection.execute(text(f"ALTER TABLE candidate_profiles {modifications}"))
+
+
+def migrate_sqlite(engine):
+    """SQLite can't change column types, so copy the rows into a freshly created table"""
+    from app import CandidateProfile
+    table = CandidateProfile.__table__
+    with engine.connect() as connection:
+        # Child tables (candidate_skills, ...) must keep referencing candidate_profiles through
+        # the rename, and dropping the old table must not cascade into them
+        connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        connection.exec_driver_sql("PRAGMA legacy_alter_table=ON")
+        connection.commit()
+        try:
+            with connection.begin():
+                copy_sqlite_table(connection, table)
+        finally:
+            connection.exec_driver_sql("PRAGMA legacy_alter_table=OFF")
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+            connection.commit()
+
+
+def copy_sqlite_table(connection, table):
+    """Rename the old table, create the new one and copy the normalized rows across"""
+    old_columns = [column['name'] for column in inspect(connection).get_columns('candidate_profiles')]
+    columns = [column.name for column in table.columns if column.name in old_columns]
+    # Old single-column indexes keep their names after the rename and would clash with the new ones
+    for index in inspect(connection).get_indexes('candidate_profiles'):
+        if index['name'] and index['name'].startswith('ix_candidate_profiles_'):
+            connection.execute(text(f"DROP INDEX {index['name']}"))
+    connection.execute(text("ALTER TABLE candidate_profiles RENAME TO candidate_profiles_old"))
+    table.create(connection)
+
+    migrated = 0
+    for rows in iter_rows(connection, 'candidate_profiles_old', columns):
+        connection.execute(table.insert(), [dict(row, **normalize_row(row)) for row in rows])
+        migrated += len(rows)
+        print(f"🔄 Copied {migrated} rows")
+    connection.execute(text("DROP TABLE candidate_profiles_old"))
+
+
+def migrate_typed_columns():
+    """
+    Convert cgpa, academic_percentage, graduation_year and uploaded_at from strings
+    to typed columns and index the columns the shortlist filters on. Values that
+    can't be parsed become NULL. Safe to run more than once.
+    """
+    from app import engine
+    existing = {column['name']: column['type'] for column in inspect(engine).get_columns('candidate_profiles')}
+    pending = [name for name, _, python_type in TYPED_COLUMNS
+               if name in existing and not isinstance(existing[name], python_type)]
+
+    if pending:
+        print(f"🔄 Converting columns to typed values: {', '.join(pending)}")
+        if engine.dialect.name == 'sqlite':
+            migrate_sqlite(engine)
+        else:
+            migrate_mysql(engine)
+    else:
+        print("ℹ️ Academic and date columns are already typed")
+
+    existing_indexes = {
+        tuple(index['column_names']) for index in inspect(engine).get_indexes('candidate_profiles')
+    }
+    with engine.begin() as connection:
+        for column_name in INDEXED_COLUMNS:
+            if (column_name,) not in existing_indexes:
+                connection.execute(text(
+                    f"CREATE INDEX ix_candidate_profiles_{column_name} ON candidate_profiles ({column_name})"
+                ))
+                print(f"✅ Added index on {column_name}")
+
+
+def backfill_candidate_skills():
+    """
+    Rebuild the candidate_skills rows from the JSON skills column. The app keeps
+    them in sync for new uploads; this covers profiles stored by older versions.
+    """
+    from app import engine, Base, CandidateSkill, canonical_skill
+    Base.metadata.create_all(engine, tables=[CandidateSkill.__table__])
+    table = CandidateSkill.__table__
+    with engine.begin() as connection:
+        backfilled = 0
+        for rows in iter_rows(connection, 'candidate_profiles', ['id', 'skills']):
+            skill_rows = []
+            for row in rows:
+                try:
+                    skills = json.loads(row['skills']) if row['skills'] else []
+                except (TypeError, ValueError):
+                    skills = str(row['skills']).split(',')
+                if not isinstance(skills, list):
+                    skills = []
+                canonical = {canonical_skill(skill) for skill in skills if str(skill).strip()}
+                skill_rows.extend({'candidate_id': row['id'], 'skill_canonical': skill} for skill in sorted(canonical))
+            connection.execute(table.delete().where(table.c.candidate_id.in_([row['id'] for row in rows])))
+            if skill_rows:
+                connection.execute(table.insert(), skill_rows)
+            backfilled += len(rows)
+            print(f"🔄 Indexed skills for {backfilled} candidates")
+
+
+def backfill_search_columns():
+    """
+    Add the phone_digits column if it's missing, then fill it and the name trigram
+    table from the stored phone numbers and names.
+    """
+    from app import engine, Base, CandidateNameTrigram, normalize_phone, name_trigrams
+    Base.metadata.create_all(engine, tables=[CandidateNameTrigram.__table__])
+    columns = {column['name'] for column in inspect(engine).get_columns('candidate_profiles')}
+    indexes = {tuple(index['column_names']) for index in inspect(engine).get_indexes('candidate_profiles')}
+    with engine.begin() as connection:
+        if 'phone_digits' not in columns:
+            connection.execute(text("ALTER TABLE candidate_profiles ADD COLUMN phone_digits VARCHAR(20)"))
+            print("✅ Added column: phone_digits")
+        if ('phone_digits',) not in indexes:
+            connection.execute(text(
+                "CREATE INDEX ix_candidate_profiles_phone_digits ON candidate_profiles (phone_digits)"
+            ))
+            print("✅ Added index on phone_digits")
+
+    table = CandidateNameTrigram.__table__
+    with engine.begin() as connection:
+        backfilled = 0
+        for rows in iter_rows(connection, 'candidate_profiles', ['id', 'name', 'phone']):
+            connection.execute(
+                text("UPDATE candidate_profiles SET phone_digits = :digits WHERE id = :id"),
+                [{'id': row['id'], 'digits': normalize_phone(row['phone'])} for row in rows]
+            )
+            connection.execute(table.delete().where(table.c.candidate_id.in_([row['id'] for row in rows])))
+            trigram_rows = [
+                {'candidate_id': row['id'], 'trigram': trigram}
+                for row in rows for trigram in sorted(name_trigrams(row['name']))
+            ]
+            if trigram_rows:
+                connection.execute(table.insert(), trigram_rows)
+            backfilled += len(rows)
+            print(f"🔄 Indexed names and phone numbers for {backfilled} candidates")
+
+
+def add_resume_search_index():
+    """
+    Create the full-text index over candidate_profiles.resume: a FULLTEXT index on
+    MySQL, the FTS5 table and its sync triggers on SQLite. Resumes stored before
+    the text was kept have nothing to index until they are uploaded again.
+    """
+    from app import engine, ensure_resume_search_index
+    if engine.dialect.name == 'mysql':
+        indexes = {index['name'] for index in inspect(engine).get_indexes('candidate_profiles')}
+        if 'ix_candidate_profiles_resume_fulltext' not in indexes:
+            with engine.begin() as connection:
+                connection.execute(text(
+                    "ALTER TABLE candidate_profiles ADD FULLTEXT INDEX ix_candidate_profiles_resume_fulltext (resume)"
+                ))
+            print("✅ Added FULLTEXT index on resume")
+    # On SQLite this also restores the triggers if migrate_typed_columns rebuilt the table
+    if ensure_resume_search_index():
+        print("✅ Full-text resume index is ready")
+
+
+
+def add_upload_job_deferred_column():
+    """Add the llm_deferred flag to an upload_jobs table created before it existed."""
+    from app import engine
+    columns = {column['name'] for column in inspect(engine).get_columns('upload_jobs')}
+    if 'llm_deferred' in columns:
+        return
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE upload_jobs ADD COLUMN llm_deferred BOOLEAN"))
+        connection.execute(text("CREATE INDEX ix_upload_jobs_llm_deferred ON upload_jobs (llm_deferred)"))
+    print("✅ Added column: upload_jobs.llm_deferred")
+
+
 if __name__ == "__main__":
     print("🔄 Updating database schema...")
-    update_database_schema()
+    from app import engine
+    if engine.dialect.name == 'mysql':
+        update_database_schema()
+    migrate_typed_columns()
+    backfill_candidate_skills()
+    backfill_search_columns()
+    add_resume_search_index()
+    add_upload_job_deferred_column()
     print("✅ Database update completed!") 
\ No newline at end of file